@@ -4,6 +4,6 @@ __version__ = "0.1.0"
 __author__ = "dgorshkov"
 
 from .analyzer import GDScriptAnalyzer
-from .rules.base import Rule, RuleViolation, Severity
+from .rules.base import FileView, LineRule, Rule, RuleViolation, Severity
 
-__all__ = ["GDScriptAnalyzer", "Rule", "RuleViolation", "Severity"]
+__all__ = ["GDScriptAnalyzer", "FileView", "LineRule", "Rule", "RuleViolation", "Severity"]
@@ -1,14 +1,154 @@
 """Main analyzer for GDScript files."""
 
+import hashlib
 import os
+import queue
+import sys
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from itertools import chain, groupby, islice
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 import json
+from json.encoder import encode_basestring_ascii
 
-from .rules.base import Rule, RuleViolation, Severity
+from . import __version__
+from .cache import FileState, ResultCache
+from .io_backend import decode_source, normalize_newlines, prefetch, read_source
+from .rules.base import FileView, LineRule, LineRuleSet, Rule, RuleCategory, RuleViolation, Severity
 from .rules import readability, security, performance
 
 
+# Below this many files, worker start-up costs more than it saves.
+_PARALLEL_MIN_FILES = 4
+
+# Number of distinct file bodies whose results are kept in memory per analyzer.
+_RESULT_LRU_SIZE = 2048
+
+# Threads reading files ahead of the worker processes running the rules.
+_READER_THREADS = 8
+
+# With the readahead backend, reads are queued with the kernel this many files
+# at a time, ahead of the reader threads that load them.
+_PREFETCH_FILES = 64
+
+# Loaded files are sent to the worker processes in batches of about this many
+# bytes, so small files share one round trip instead of paying one each.
+_BATCH_BYTES = 64 * 1024
+
+# A batch also holds at most 1/(workers * this) of the files to analyze, so a
+# small project is still spread over every worker.
+_BATCHES_PER_WORKER = 4
+
+# Files modified this recently are not cached by their stat: a further write
+# within the file system's timestamp granularity would go unnoticed.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Enum values and output markers, looked up once instead of per violation
+_SEVERITY_VALUE = {severity: severity.value for severity in Severity}
+_CATEGORY_VALUE = {category: category.value for category in RuleCategory}
+_SEVERITY_ICON = {
+    Severity.ERROR: '✗',
+    Severity.WARNING: '⚠',
+    Severity.INFO: 'ℹ'
+}
+_GITHUB_LEVEL = {
+    Severity.ERROR: 'error',
+    Severity.WARNING: 'warning',
+    Severity.INFO: 'notice'
+}
+# Start of each annotation line, up to the file name
+_GITHUB_PREFIX = {severity: f"::{level} file=" for severity, level in _GITHUB_LEVEL.items()}
+
+# Formatter method for each output format; any other format is plain text
+_FORMATTERS = {
+    'text': '_iter_format_text',
+    'json': '_iter_format_json',
+    'github': '_iter_format_github'
+}
+
+# A violation object as json.dumps(indent=2) lays it out two levels deep in
+# the JSON report. Strings are escaped by the same C function json.dumps uses.
+_VIOLATION_JSON = (
+    '    {\n'
+    '      "rule_id": %s,\n'
+    '      "rule_name": %s,\n'
+    '      "severity": %s,\n'
+    '      "category": %s,\n'
+    '      "message": %s,\n'
+    '      "file": %s,\n'
+    '      "line": %d,\n'
+    '      "column": %s,\n'
+    '      "code_snippet": %s\n'
+    '    }'
+)
+_SEVERITY_JSON = {severity: encode_basestring_ascii(severity.value) for severity in Severity}
+_CATEGORY_JSON = {category: encode_basestring_ascii(category.value) for category in RuleCategory}
+
+# Analyzer used by the current worker process, installed by _init_worker.
+_worker_analyzer: Optional['GDScriptAnalyzer'] = None
+
+
+def _init_worker(analyzer: 'GDScriptAnalyzer'):
+    """Keep one analyzer per worker process so its result cache persists."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+    if analyzer.cache is not None:
+        # A forked worker inherits the parent's open connection
+        analyzer.cache.detach()
+
+
+def _analyze_in_worker(batch: List[Tuple[str, str, Optional[FileState]]]) -> List[List[RuleViolation]]:
+    """Analyze a batch of (file path, content, file state) with this worker's analyzer."""
+    return [_worker_analyzer._analyze_loaded(file_path, content, state) for file_path, content, state in batch]
+
+
+def _walk_gd_files(directory: str) -> Iterator[str]:
+    """
+    Yield the .gd files under a directory as they are found.
+    
+    Paths are produced in the same order and form as Path.rglob('*.gd'):
+    each directory's files first, then its subdirectories depth-first,
+    without following directory symlinks.
+    
+    Args:
+        directory: Path to the directory to walk
+    """
+    root = str(Path(directory))
+    if root == '.':
+        # pathlib drops a leading "./" from the paths it builds
+        prefix = ''
+    else:
+        prefix = root if root.endswith(os.sep) else root + os.sep
+    
+    pending = [(root, prefix)]
+    while pending:
+        scan_path, prefix = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(scan_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(prefix + entry.name)
+                    elif os.path.normcase(entry.name).endswith('.gd'):
+                        yield prefix + entry.name
+        except OSError:
+            # Unreadable directories are skipped, as rglob does
+            continue
+        
+        # Pushed in reverse so they are popped in scan order
+        for subdir in reversed(subdirs):
+            pending.append((subdir, subdir + os.sep))
+
+
+def _report_error(file_path: str, error: Exception):
+    """Report a file that could not be analyzed without aborting the run."""
+    print(f"Error analyzing {file_path}: {error}", file=sys.stderr)
+
+
 class GDScriptAnalyzer:
     """Analyzes GDScript files for code smells and issues."""
     
@@ -22,6 +162,13 @@ class GDScriptAnalyzer:
         self.config = config or {}
         self.rules: List[Rule] = []
         self._load_rules()
+        self.cache: Optional[ResultCache] = None
+        if self.config.get('cache', False):
+            self.cache = ResultCache(self.config.get('cache_path'))
+        # (content digest, rule signatures) -> (file path, violations)
+        self._results: 'OrderedDict[Tuple[bytes, Tuple[str, ...]], Tuple[str, List[RuleViolation]]]' = OrderedDict()
+        # rule -> (settings the signature was computed from, signature)
+        self._signatures: Dict[Rule, Tuple[list, str]] = {}
     
     def _load_rules(self):
         """Load all available rules."""
@@ -49,6 +196,49 @@ class GDScriptAnalyzer:
         disabled_rules = self.config.get('disabled_rules', [])
         self.rules = [rule for rule in self.rules if rule.rule_id not in disabled_rules]
     
+    def _rule_signatures(self) -> Dict[Rule, str]:
+        """Fingerprint of each rule and its settings, for keying cached results."""
+        signatures = {}
+        for rule in self.rules:
+            # Only hash again when a rule's settings have changed since the last file
+            settings = sorted(vars(rule).items())
+            memo = self._signatures.get(rule)
+            if memo is None or memo[0] != settings:
+                signature = hashlib.sha256(
+                    f"{__version__}\n{rule.rule_id}:{settings}".encode('utf-8')
+                ).hexdigest()
+                memo = self._signatures[rule] = (settings, signature)
+            signatures[rule] = memo[1]
+        return signatures
+    
+    def _file_state(self, file_path: str) -> Optional[FileState]:
+        """
+        Stat of a file and fingerprint of the rule set, for the cache's fast path.
+        
+        The file is identified by its absolute path, so the same relative
+        path in different projects is never confused, and by its inode
+        and change time, which catch a file replaced by another one with
+        the same size and modification time.
+        
+        Args:
+            file_path: Path to the file
+        
+        Returns:
+            (absolute path, mtime in ns, size, inode, ctime in ns, rule set key),
+            or None if the file cannot be looked up by its stat
+        """
+        if self.cache is None:
+            return None
+        try:
+            abs_path = os.path.abspath(file_path)
+            stat = os.stat(abs_path)
+        except OSError:
+            return None
+        if stat.st_mtime_ns > time.time_ns() - _RACY_WINDOW_NS:
+            return None
+        rules_key = hashlib.sha256('\n'.join(self._rule_signatures().values()).encode('utf-8')).hexdigest()
+        return abs_path, stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_ctime_ns, rules_key
+    
     def analyze_file(self, file_path: str) -> List[RuleViolation]:
         """
         Analyze a single GDScript file.
@@ -59,22 +249,132 @@ class GDScriptAnalyzer:
         Returns:
             List of rule violations found
         """
-        violations = []
+        # The stat is taken before reading, so a later edit changes it
+        state = self._file_state(file_path)
+        if state is not None:
+            cached = self.cache.get_file(file_path, state)
+            if cached is not None:
+                return cached
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            for rule in self.rules:
-                if rule.enabled:
-                    violations.extend(rule.check(file_path, content))
+            content = read_source(file_path)
+        except Exception as e:
+            _report_error(file_path, e)
+            return []
+        
+        return self._analyze_loaded(file_path, content, state)
+    
+    def analyze_source(self, content: str, file_path: str = "<memory>") -> List[RuleViolation]:
+        """
+        Analyze GDScript source that is already in memory.
+        
+        Args:
+            content: Source text to analyze
+            file_path: Path to report violations against
+        
+        Returns:
+            List of rule violations found
+        """
+        return self._analyze_loaded(file_path, normalize_newlines(content))
+    
+    def analyze_bytes(self, data: bytes, file_path: str = "<memory>") -> List[RuleViolation]:
+        """
+        Analyze UTF-8 encoded GDScript source that is already in memory.
+        
+        Args:
+            data: Encoded source to analyze
+            file_path: Path to report violations against
+        
+        Returns:
+            List of rule violations found
+        """
+        try:
+            content = decode_source(data)
+        except Exception as e:
+            _report_error(file_path, e)
+            return []
         
+        # Valid UTF-8 round-trips exactly, so unless line endings were
+        # rewritten the given bytes can be hashed without encoding again
+        encoded = data if b'\r' not in data else None
+        return self._analyze_loaded(file_path, content, encoded=encoded)
+    
+    def _analyze_loaded(self, file_path: str, content: str,
+                        state: Optional[FileState] = None,
+                        encoded: Optional[bytes] = None) -> List[RuleViolation]:
+        """Analyze already loaded content, reporting errors instead of raising."""
+        try:
+            violations = self._analyze_content(file_path, content, encoded)
         except Exception as e:
-            import sys
-            print(f"Error analyzing {file_path}: {e}", file=sys.stderr)
+            _report_error(file_path, e)
+            return []
         
+        if state is not None:
+            self.cache.put_file(state, violations)
         return violations
     
+    def _analyze_content(self, file_path: str, content: str, encoded: Optional[bytes] = None) -> List[RuleViolation]:
+        """Run the rules over already loaded content, reusing earlier results."""
+        content_sha = hashlib.sha256(content.encode('utf-8') if encoded is None else encoded).digest()
+        rule_sigs = self._rule_signatures()
+        key = (content_sha, tuple(rule_sigs.values()))
+        
+        # Identical bodies (vendored addons, generated boilerplate) are only analyzed once
+        hit = self._results.get(key)
+        if hit is not None:
+            self._results.move_to_end(key)
+            cached_path, violations = hit
+            if cached_path != file_path:
+                return [replace(v, file_path=file_path) for v in violations]
+            return list(violations)
+        
+        view = FileView(content)
+        # Skip rules whose needles do not occur anywhere in the file
+        active = [rule for rule in self.rules if rule.enabled and rule.applies_to(view)]
+        
+        # Results are cached per rule, so only rules without a cached
+        # result for this content (new or reconfigured ones) are run
+        found: Dict[Rule, List[RuleViolation]] = {}
+        if self.cache is not None:
+            cached = self.cache.get(file_path, content_sha.hex(), [rule_sigs[rule] for rule in active])
+            found = {rule: cached[rule_sigs[rule]] for rule in active if rule_sigs[rule] in cached}
+        
+        missing = [rule for rule in active if rule not in found]
+        if missing:
+            fresh = self._run_rules(file_path, view, missing)
+            found.update(fresh)
+            if self.cache is not None:
+                self.cache.put(file_path, content_sha.hex(), {rule_sigs[rule]: fresh[rule] for rule in fresh})
+        
+        # Report in rule order, whichever way each rule was run
+        violations = [violation for rule in active for violation in found[rule]]
+        
+        self._results[key] = (file_path, violations)
+        if len(self._results) > _RESULT_LRU_SIZE:
+            self._results.popitem(last=False)
+        
+        return list(violations)
+    
+    def _run_rules(self, file_path: str, view: FileView, rules: List[Rule]) -> Dict[Rule, List[RuleViolation]]:
+        """Run the given rules over a file, returning each rule's violations."""
+        # Line rules share one pass over the lines, and the performance
+        # rules share their function and loop bookkeeping
+        found: Dict[Rule, List[RuleViolation]] = {}
+        line_rules = [rule for rule in rules if isinstance(rule, LineRule)]
+        if line_rules:
+            found.update(LineRuleSet(line_rules).check_rules(file_path, view))
+        performance_rules = [
+            rule for rule in rules
+            if isinstance(rule, performance.PerformanceRuleSet.RULE_TYPES)
+        ]
+        if performance_rules:
+            found.update(performance.PerformanceRuleSet(performance_rules).check_rules(file_path, view))
+        
+        for rule in rules:
+            if rule not in found:
+                found[rule] = rule.check_view(file_path, view)
+        return found
+    
     def analyze_directory(self, directory: str) -> List[RuleViolation]:
         """
         Analyze all GDScript files in a directory.
@@ -86,11 +386,111 @@ class GDScriptAnalyzer:
             List of all rule violations found
         """
         violations = []
-        path = Path(directory)
+        readahead = self.config.get('io_backend', 'sync') == 'readahead'
+        # Worker processes are opt-in: under the spawn start method they
+        # re-import the caller's main module, which library callers may not guard
+        max_workers = self.config.get('jobs') or 1
         
-        # Find all .gd files
-        for gd_file in path.rglob('*.gd'):
-            violations.extend(self.analyze_file(str(gd_file)))
+        # Files are discovered lazily, so analysis starts before the walk ends
+        files = _walk_gd_files(directory)
+        first = list(islice(files, _PARALLEL_MIN_FILES))
+        
+        if max_workers == 1 or len(first) < _PARALLEL_MIN_FILES:
+            gd_files = first + list(files)
+            if readahead:
+                prefetch(gd_files)
+            for gd_file in gd_files:
+                violations.extend(self.analyze_file(gd_file))
+            return violations
+        
+        # The walk, file reads and rule runs overlap: this thread walks the
+        # tree, reader threads load each file as it is found, and this
+        # thread hands loaded files to the worker processes in batches
+        results: List[Optional[List[RuleViolation]]] = []
+        batches: List[Tuple[List[int], Future]] = []
+        pending: List[Tuple[int, str, str, Optional[FileState]]] = []
+        pending_bytes = 0
+        # Files found so far that need analysis, for sizing batches
+        to_analyze = 0
+        # Reads in progress, and reads that have finished in completion order
+        reading: Dict[Future, Tuple[int, str, Optional[FileState]]] = {}
+        to_read: List[Tuple[int, str, Optional[FileState]]] = []
+        loaded: 'queue.SimpleQueue[Future]' = queue.SimpleQueue()
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker, initargs=(self,)) as workers:
+            def submit_batch():
+                nonlocal pending_bytes
+                batch = [(gd_file, content, state) for _, gd_file, content, state in pending]
+                batches.append(([entry[0] for entry in pending], workers.submit(_analyze_in_worker, batch)))
+                pending.clear()
+                pending_bytes = 0
+            
+            def add_loaded(index: int, gd_file: str, state: Optional[FileState], content: str):
+                nonlocal pending_bytes
+                pending.append((index, gd_file, content, state))
+                pending_bytes += len(content)
+                batch_files = to_analyze // (max_workers * _BATCHES_PER_WORKER)
+                if pending_bytes >= _BATCH_BYTES or len(pending) >= batch_files or not batches:
+                    submit_batch()
+            
+            def take_read(read: Future):
+                index, gd_file, state = reading.pop(read)
+                try:
+                    content = read.result()
+                except Exception as e:
+                    _report_error(gd_file, e)
+                    return
+                add_loaded(index, gd_file, state, content)
+            
+            def start_reads():
+                if readahead:
+                    prefetch([gd_file for _, gd_file, _ in to_read])
+                for entry in to_read:
+                    read = readers.submit(read_source, entry[1])
+                    reading[read] = entry
+                    read.add_done_callback(loaded.put)
+                to_read.clear()
+            
+            # Reader threads are only started by their first submission
+            with ThreadPoolExecutor(max_workers=_READER_THREADS) as readers:
+                for index, gd_file in enumerate(chain(first, files)):
+                    state = self._file_state(gd_file)
+                    results.append(None if state is None else self.cache.get_file(gd_file, state))
+                    if results[index] is not None:
+                        continue
+                    to_analyze += 1
+                    if not batches:
+                        # The first file is read and submitted before any reader
+                        # thread exists: with the fork start method the pool forks
+                        # all its workers on its first submission, and forking a
+                        # process that has threads can deadlock the child
+                        try:
+                            content = read_source(gd_file)
+                        except Exception as e:
+                            _report_error(gd_file, e)
+                            continue
+                        add_loaded(index, gd_file, state, content)
+                        continue
+                    to_read.append((index, gd_file, state))
+                    if not readahead or len(to_read) >= _PREFETCH_FILES:
+                        start_reads()
+                    # Batch up whatever has been read so far without waiting
+                    while not loaded.empty():
+                        take_read(loaded.get())
+                start_reads()
+                while reading:
+                    take_read(loaded.get())
+            if pending:
+                submit_batch()
+            
+            for indexes, batch in batches:
+                for index, found in zip(indexes, batch.result()):
+                    results[index] = found
+        
+        # Report in discovery order regardless of completion order
+        for found in results:
+            if found is not None:
+                violations.extend(found)
         
         return violations
     
@@ -121,27 +521,17 @@ class GDScriptAnalyzer:
         Returns:
             Dictionary with summary statistics
         """
-        summary = {
+        # Count enum members in C, then convert the few distinct keys to values
+        by_severity = Counter(map(attrgetter('severity'), violations))
+        by_category = Counter(map(attrgetter('category'), violations))
+        by_file = Counter(map(attrgetter('file_path'), violations))
+        
+        return {
             'total': len(violations),
-            'by_severity': {},
-            'by_category': {},
-            'by_file': {}
+            'by_severity': {_SEVERITY_VALUE[s]: n for s, n in by_severity.items()},
+            'by_category': {_CATEGORY_VALUE[c]: n for c, n in by_category.items()},
+            'by_file': dict(by_file)
         }
-        
-        for violation in violations:
-            # Count by severity
-            severity = violation.severity.value
-            summary['by_severity'][severity] = summary['by_severity'].get(severity, 0) + 1
-            
-            # Count by category
-            category = violation.category.value
-            summary['by_category'][category] = summary['by_category'].get(category, 0) + 1
-            
-            # Count by file
-            file_path = violation.file_path
-            summary['by_file'][file_path] = summary['by_file'].get(file_path, 0) + 1
-        
-        return summary
     
     def format_violations(self, violations: List[RuleViolation], format_type: str = 'text') -> str:
         """
@@ -154,95 +544,98 @@ class GDScriptAnalyzer:
         Returns:
             Formatted string
         """
-        if format_type == 'json':
-            return self._format_json(violations)
-        elif format_type == 'github':
-            return self._format_github(violations)
-        else:
-            return self._format_text(violations)
+        return '\n'.join(self.iter_format(violations, format_type))
+    
+    def iter_format(self, violations: List[RuleViolation], format_type: str = 'text') -> Iterator[str]:
+        """
+        Format violations for output one line at a time.
+        
+        Lines are produced as they are formatted, so a large report can be
+        written out without first being assembled in memory.
+        
+        Args:
+            violations: List of violations
+            format_type: Output format ('text', 'json', 'github')
+        
+        Returns:
+            Iterator over output lines, without trailing newlines
+        """
+        return getattr(self, _FORMATTERS.get(format_type, '_iter_format_text'))(violations)
     
-    def _format_text(self, violations: List[RuleViolation]) -> str:
+    def _iter_format_text(self, violations: List[RuleViolation]) -> Iterator[str]:
         """Format violations as plain text."""
         if not violations:
-            return "✓ No issues found!"
+            yield "✓ No issues found!"
+            return
         
-        output = []
-        output.append(f"Found {len(violations)} issue(s):\n")
+        yield f"Found {len(violations)} issue(s):\n"
         
-        # Group by file
-        by_file = {}
-        for v in violations:
-            if v.file_path not in by_file:
-                by_file[v.file_path] = []
-            by_file[v.file_path].append(v)
-        
-        for file_path, file_violations in sorted(by_file.items()):
-            output.append(f"\n{file_path}:")
-            for v in sorted(file_violations, key=lambda x: x.line_number):
-                severity_icon = {
-                    Severity.ERROR: '✗',
-                    Severity.WARNING: '⚠',
-                    Severity.INFO: 'ℹ'
-                }.get(v.severity, '•')
+        # Group by file with a single stable sort by file, then line
+        ordered = sorted(violations, key=attrgetter('file_path', 'line_number'))
+        for file_path, file_violations in groupby(ordered, key=attrgetter('file_path')):
+            yield f"\n{file_path}:"
+            for v in file_violations:
+                severity_icon = _SEVERITY_ICON.get(v.severity, '•')
                 
-                output.append(f"  {severity_icon} Line {v.line_number}: [{v.rule_id}] {v.message}")
-                output.append(f"    Category: {v.category.value}")
+                yield f"  {severity_icon} Line {v.line_number}: [{v.rule_id}] {v.message}"
+                yield f"    Category: {_CATEGORY_VALUE[v.category]}"
         
         summary = self.get_summary(violations)
-        output.append(f"\n\nSummary:")
-        output.append(f"  Total issues: {summary['total']}")
-        output.append(f"  Errors: {summary['by_severity'].get('error', 0)}")
-        output.append(f"  Warnings: {summary['by_severity'].get('warning', 0)}")
-        output.append(f"  Info: {summary['by_severity'].get('info', 0)}")
-        
-        return '\n'.join(output)
-    
-    def _format_json(self, violations: List[RuleViolation]) -> str:
-        """Format violations as JSON."""
-        data = {
-            'violations': [
-                {
-                    'rule_id': v.rule_id,
-                    'rule_name': v.rule_name,
-                    'severity': v.severity.value,
-                    'category': v.category.value,
-                    'message': v.message,
-                    'file': v.file_path,
-                    'line': v.line_number,
-                    'column': v.column,
-                    'code_snippet': v.code_snippet
-                }
-                for v in violations
-            ],
-            'summary': self.get_summary(violations)
-        }
-        return json.dumps(data, indent=2)
+        yield f"\n\nSummary:"
+        yield f"  Total issues: {summary['total']}"
+        yield f"  Errors: {summary['by_severity'].get('error', 0)}"
+        yield f"  Warnings: {summary['by_severity'].get('warning', 0)}"
+        yield f"  Info: {summary['by_severity'].get('info', 0)}"
     
-    def _format_github(self, violations: List[RuleViolation]) -> str:
+    def _iter_format_json(self, violations: List[RuleViolation]) -> Iterator[str]:
+        """
+        Format violations as JSON.
+        
+        The output is identical to json.dumps(data, indent=2), but each
+        violation object is filled into a fixed template instead of going
+        through the pure-Python indenting encoder, and written out as soon
+        as it is ready.
+        """
+        if not violations:
+            yield '{\n  "violations": [],'
+        else:
+            yield '{\n  "violations": ['
+            last = len(violations) - 1
+            for i, v in enumerate(violations):
+                encoded = _VIOLATION_JSON % (
+                    encode_basestring_ascii(v.rule_id),
+                    encode_basestring_ascii(v.rule_name),
+                    _SEVERITY_JSON[v.severity],
+                    _CATEGORY_JSON[v.category],
+                    encode_basestring_ascii(v.message),
+                    encode_basestring_ascii(v.file_path),
+                    v.line_number,
+                    'null' if v.column is None else '%d' % v.column,
+                    'null' if v.code_snippet is None else encode_basestring_ascii(v.code_snippet)
+                )
+                yield encoded + ',' if i < last else encoded
+            yield '  ],'
+        
+        summary = json.dumps(self.get_summary(violations), indent=2)
+        yield '  "summary": ' + summary.replace('\n', '\n  ') + '\n}'
+    
+    def _iter_format_github(self, violations: List[RuleViolation]) -> Iterator[str]:
         """Format violations as GitHub Actions annotations."""
         if not violations:
-            return "✓ No issues found!"
+            yield "✓ No issues found!"
+            return
         
-        output = []
         for v in violations:
             # GitHub Actions annotation format
-            level = {
-                Severity.ERROR: 'error',
-                Severity.WARNING: 'warning',
-                Severity.INFO: 'notice'
-            }.get(v.severity, 'notice')
-            
-            output.append(
-                f"::{level} file={v.file_path},line={v.line_number},"
+            yield (
+                f"{_GITHUB_PREFIX[v.severity]}{v.file_path},line={v.line_number},"
                 f"title=[{v.rule_id}] {v.rule_name}::{v.message}"
             )
         
         # Add summary
         summary = self.get_summary(violations)
-        output.append(f"\n📊 Analysis Summary:")
-        output.append(f"- Total issues: {summary['total']}")
-        output.append(f"- Errors: {summary['by_severity'].get('error', 0)}")
-        output.append(f"- Warnings: {summary['by_severity'].get('warning', 0)}")
-        output.append(f"- Info: {summary['by_severity'].get('info', 0)}")
-        
-        return '\n'.join(output)
+        yield f"\n📊 Analysis Summary:"
+        yield f"- Total issues: {summary['total']}"
+        yield f"- Errors: {summary['by_severity'].get('error', 0)}"
+        yield f"- Warnings: {summary['by_severity'].get('warning', 0)}"
+        yield f"- Info: {summary['by_severity'].get('info', 0)}"
@@ -0,0 +1,262 @@
+"""Persistent on-disk cache of per-file analysis results."""
+
+import json
+import os
+import sqlite3
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from .rules.base import RuleCategory, RuleViolation, Severity
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'gdsmeller', 'cache.db')
+
+# Stored in the database's user_version; a database with another version
+# was written by an incompatible release and is emptied and rebuilt.
+_SCHEMA_VERSION = 2
+
+# (absolute path, mtime in ns, size, inode, ctime in ns, rule set key):
+# what the stored results of an unchanged file are looked up by
+FileState = Tuple[str, int, int, int, int, str]
+
+# Most rows kept in each table. Past this the oldest rows are evicted,
+# checked on a connection's first store and every _EVICT_INTERVAL after.
+_MAX_ROWS = {'rule_results': 250_000, 'file_results': 50_000}
+_EVICT_INTERVAL = 256
+
+# Errors raised by _decode_violations for rows it cannot rebuild
+_DECODE_ERRORS = (ValueError, TypeError, RecursionError)
+
+
+def _encode_violations(violations: List[RuleViolation]) -> str:
+    """Serialize violations as JSON lists of plain fields, without the file path."""
+    return json.dumps([
+        [v.rule_id, v.rule_name, v.severity.value, v.category.value,
+         v.message, v.line_number, v.column, v.code_snippet]
+        for v in violations
+    ], separators=(',', ':'))
+
+
+def _decode_violations(data, file_path: str) -> List[RuleViolation]:
+    """
+    Rebuild violations stored by _encode_violations.
+    
+    Only plain JSON is parsed and every field is type-checked, so a
+    corrupted or crafted database can at worst produce a cache miss.
+    
+    Args:
+        data: Stored JSON text
+        file_path: Path to report the violations against
+    
+    Returns:
+        The stored violations
+    
+    Raises:
+        ValueError, TypeError or RecursionError if the data is malformed
+    """
+    violations = []
+    for fields in json.loads(data):
+        rule_id, rule_name, severity, category, message, line_number, column, code_snippet = fields
+        if not (
+            isinstance(rule_id, str) and isinstance(rule_name, str) and isinstance(message, str)
+            and type(line_number) is int
+            and (column is None or type(column) is int)
+            and (code_snippet is None or isinstance(code_snippet, str))
+        ):
+            raise ValueError("malformed cached violation")
+        # Repeated strings are shared, as they are between freshly created violations
+        violations.append(RuleViolation(
+            sys.intern(rule_id), sys.intern(rule_name), Severity(severity), RuleCategory(category),
+            sys.intern(message), file_path, line_number, column, code_snippet
+        ))
+    return violations
+
+
+class ResultCache:
+    """
+    SQLite-backed store of rule violations keyed by file content.
+    
+    Each rule's violations are stored separately, keyed by the SHA-256 of
+    the file content and a signature of that rule and its settings. Editing
+    a file invalidates its cached results automatically. Changing one
+    rule's settings, or enabling or disabling rules, only invalidates
+    the affected rule's results. The cache is best effort: any database
+    error, or any row that cannot be decoded, is treated as a miss.
+    Violations are stored as plain JSON, so reading a cache never runs
+    code from it.
+    
+    In front of that, the last results for each absolute path are kept
+    with the file's stat, so an unchanged file is answered from its stat
+    alone without being read or hashed.
+    
+    Both tables are bounded: once one holds more than _MAX_ROWS rows,
+    the rows stored longest ago are evicted.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: Location of the SQLite database file
+        """
+        self.path = path or DEFAULT_CACHE_PATH
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stores_until_evict = {table: 0 for table in _MAX_ROWS}
+    
+    def __getstate__(self):
+        # Connections cannot cross process boundaries; workers reopen lazily
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        return state
+    
+    def detach(self):
+        """
+        Forget a connection inherited from a parent process.
+        
+        SQLite connections must not be used across fork(), and closing one
+        in the child could checkpoint or remove the parent's WAL, so the
+        inherited connection is dropped unclosed and a new one is opened
+        when the cache is next used.
+        """
+        self._conn = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            if self._conn.execute('PRAGMA user_version').fetchone()[0] != _SCHEMA_VERSION:
+                self._create_tables(self._conn)
+        return self._conn
+    
+    @staticmethod
+    def _create_tables(conn: sqlite3.Connection):
+        """Replace the tables of a new or outdated database."""
+        with conn:
+            # Another process may be doing the same; check again under the write lock
+            conn.execute('BEGIN IMMEDIATE')
+            if conn.execute('PRAGMA user_version').fetchone()[0] == _SCHEMA_VERSION:
+                return
+            conn.execute('DROP TABLE IF EXISTS rule_results')
+            conn.execute('DROP TABLE IF EXISTS file_results')
+            conn.execute(
+                'CREATE TABLE rule_results ('
+                'file_path TEXT, content_sha TEXT, rule_sig TEXT, violations TEXT, '
+                'PRIMARY KEY (content_sha, rule_sig))'
+            )
+            conn.execute(
+                'CREATE TABLE file_results ('
+                'abs_path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, '
+                'inode INTEGER, ctime_ns INTEGER, rules_key TEXT, violations TEXT)'
+            )
+            conn.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+    
+    def _store(self, table: str, rows: List[tuple]):
+        """Insert or replace rows, evicting the oldest rows if the table is full."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    f'INSERT OR REPLACE INTO {table} VALUES ({", ".join("?" * len(rows[0]))})', rows
+                )
+                if self._stores_until_evict[table] == 0:
+                    # A replaced row gets a new, highest rowid, so rowid
+                    # order is the order rows were stored in
+                    conn.execute(
+                        f'DELETE FROM {table} WHERE rowid < '
+                        f'(SELECT rowid FROM {table} ORDER BY rowid DESC LIMIT 1 OFFSET ?)',
+                        (_MAX_ROWS[table] - 1,)
+                    )
+                    self._stores_until_evict[table] = _EVICT_INTERVAL
+                self._stores_until_evict[table] -= 1
+        except (sqlite3.Error, OSError):
+            pass
+    
+    def get(self, file_path: str, content_sha: str, rule_sigs: List[str]) -> Dict[str, List[RuleViolation]]:
+        """
+        Look up cached violations for a file.
+        
+        Args:
+            file_path: Path the violations should be reported against
+            content_sha: Hex SHA-256 of the file content
+            rule_sigs: Signatures of the rules to look up
+        
+        Returns:
+            Violations by rule signature, for the rules that were cached
+        """
+        if not rule_sigs:
+            return {}
+        
+        try:
+            rows = self._connect().execute(
+                'SELECT rule_sig, violations FROM rule_results '
+                f'WHERE content_sha = ? AND rule_sig IN ({", ".join("?" * len(rule_sigs))})',
+                (content_sha, *rule_sigs)
+            ).fetchall()
+        except (sqlite3.Error, OSError):
+            return {}
+        
+        found = {}
+        for rule_sig, data in rows:
+            try:
+                # Reported against this file even if cached under another name
+                found[rule_sig] = _decode_violations(data, file_path)
+            except _DECODE_ERRORS:
+                continue
+        return found
+    
+    def put(self, file_path: str, content_sha: str, results: Dict[str, List[RuleViolation]]):
+        """
+        Store the violations found for a file.
+        
+        Args:
+            file_path: Path of the analyzed file
+            content_sha: Hex SHA-256 of the file content
+            results: Violations found in the file, by rule signature
+        """
+        rows = [
+            (file_path, content_sha, rule_sig, _encode_violations(violations))
+            for rule_sig, violations in results.items()
+        ]
+        if rows:
+            self._store('rule_results', rows)
+    
+    def get_file(self, file_path: str, state: FileState) -> Optional[List[RuleViolation]]:
+        """
+        Look up the violations last stored for an unchanged file.
+        
+        Args:
+            file_path: Path the violations should be reported against
+            state: Current state of the file and rule set
+        
+        Returns:
+            The stored violations, or None if the file or rules have changed
+        """
+        try:
+            row = self._connect().execute(
+                'SELECT violations FROM file_results '
+                'WHERE abs_path = ? AND mtime_ns = ? AND size = ? AND inode = ? AND ctime_ns = ? AND rules_key = ?',
+                state
+            ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+        if row is None:
+            return None
+        try:
+            return _decode_violations(row[0], file_path)
+        except _DECODE_ERRORS:
+            return None
+    
+    def put_file(self, state: FileState, violations: List[RuleViolation]):
+        """
+        Store the violations found for a file along with its stat.
+        
+        Args:
+            state: State of the file and rule set before it was read
+            violations: Violations found in the file
+        """
+        self._store('file_results', [(*state, _encode_violations(violations))])
@@ -2,13 +2,19 @@
 """Main entry point for GDSmeller."""
 
 import argparse
+import os
 import sys
 import json
 from typing import Optional, Dict
 
 from .analyzer import GDScriptAnalyzer
+from .io_backend import IO_BACKENDS
 from .rules.base import Severity
 
+# Settings a project's config file may not choose: where cached results
+# are read from must be decided by the person running the tool
+_CLI_ONLY_OPTIONS = ('cache', 'cache_path')
+
 
 def load_config(config_path: Optional[str]) -> Dict:
     """Load configuration from file."""
@@ -23,6 +29,24 @@ def load_config(config_path: Optional[str]) -> Dict:
         return {}
 
 
+def _positive_int(value: str) -> int:
+    """Parse a count that must be at least one, for argparse."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, not {value!r}")
+    return number
+
+
+def _available_cpus() -> int:
+    """Number of CPUs this process may run on, honoring its affinity mask where supported."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -71,6 +95,29 @@ Examples:
         help='Exit with error code if warnings are found'
     )
     
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse results for unchanged files from ~/.cache/gdsmeller'
+    )
+    
+    parser.add_argument(
+        '--cache-path',
+        help='Location of the result cache used with --cache (default: ~/.cache/gdsmeller/cache.db)'
+    )
+    
+    parser.add_argument(
+        '--io-backend',
+        choices=IO_BACKENDS,
+        help='How source files are read (default: sync; readahead queues all reads up front on Linux)'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        type=_positive_int,
+        help='Number of worker processes for directories (default: one per available CPU; 1 disables parallelism)'
+    )
+    
     parser.add_argument(
         '--version',
         action='store_true',
@@ -86,6 +133,23 @@ Examples:
     
     # Load configuration
     config = load_config(args.config)
+    for option in _CLI_ONLY_OPTIONS:
+        if option in config:
+            del config[option]
+            print(f"Warning: Ignoring '{option}' in config file; use --{option.replace('_', '-')}", file=sys.stderr)
+    if args.cache:
+        config['cache'] = True
+    if args.cache_path:
+        config['cache_path'] = args.cache_path
+    if args.io_backend:
+        config['io_backend'] = args.io_backend
+    jobs = config.get('jobs')
+    if jobs is not None and (type(jobs) is not int or jobs < 1):
+        parser.error(f"'jobs' in config file must be a positive integer, not {jobs!r}")
+    if args.jobs:
+        config['jobs'] = args.jobs
+    # Unlike the Python API, the command line uses every available CPU by default
+    config.setdefault('jobs', _available_cpus())
     
     # Create analyzer
     analyzer = GDScriptAnalyzer(config)
@@ -97,13 +161,20 @@ Examples:
         print(f"Error: {e}", file=sys.stderr)
         return 1
     
-    # Format and print output
-    output = analyzer.format_violations(violations, args.output_format)
-    print(output)
+    # Format and print output, writing lines as they are produced
+    sys.stdout.writelines(line + '\n' for line in analyzer.iter_format(violations, args.output_format))
     
     # Determine exit code
-    has_errors = any(v.severity == Severity.ERROR for v in violations)
-    has_warnings = any(v.severity == Severity.WARNING for v in violations)
+    # One pass over the violations, stopping once both severities are seen
+    has_errors = has_warnings = False
+    for v in violations:
+        severity = v.severity
+        if severity is Severity.ERROR:
+            has_errors = True
+        elif severity is Severity.WARNING:
+            has_warnings = True
+        if has_errors and has_warnings:
+            break
     
     if has_errors:
         return 1
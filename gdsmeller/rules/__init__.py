@@ -1,11 +1,13 @@
 """Rules module for GDSmeller."""
 
-from .base import Rule, RuleViolation, Severity, RuleCategory
+from .base import FileView, LineRule, Rule, RuleViolation, Severity, RuleCategory
 from . import readability
 from . import security
 from . import performance
 
 __all__ = [
+    "FileView",
+    "LineRule",
     "Rule",
     "RuleViolation",
     "Severity",
@@ -1,9 +1,11 @@
 """Base classes for rules."""
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
 
 
 class Severity(Enum):
@@ -22,9 +24,18 @@ class RuleCategory(Enum):
     BEST_PRACTICES = "best_practices"
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10; older versions fall back to __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class RuleViolation:
-    """Represents a violation of a rule."""
+    """
+    Represents a violation of a rule.
+    
+    Violations are immutable (use dataclasses.replace to derive a copy)
+    and hashable, so duplicates can be removed with a set.
+    """
     rule_id: str
     rule_name: str
     severity: Severity
@@ -34,10 +45,180 @@ class RuleViolation:
     line_number: int
     column: Optional[int] = None
     code_snippet: Optional[str] = None
+    
+    def __reduce__(self):
+        # Violations cross process and cache boundaries as pickles, and each
+        # pickle carries its own copy of the strings that repeat across files
+        return (_restore_violation, (
+            self.rule_id, self.rule_name, self.severity, self.category, self.message,
+            self.file_path, self.line_number, self.column, self.code_snippet
+        ))
+
+
+def _restore_violation(
+    rule_id: str,
+    rule_name: str,
+    severity: Severity,
+    category: RuleCategory,
+    message: str,
+    file_path: str,
+    line_number: int,
+    column: Optional[int],
+    code_snippet: Optional[str]
+) -> RuleViolation:
+    """Rebuild a pickled violation, interning its rule, message and path strings."""
+    intern = sys.intern
+    return RuleViolation(
+        intern(rule_id), intern(rule_name), severity, category, intern(message),
+        intern(file_path), line_number, column, code_snippet
+    )
+
+
+@dataclass
+class FileView:
+    """
+    Content of a file being checked, shared by all rules.
+    
+    The analyzer builds one view per file so the line split, the lowercased
+    content and the newline offset index are computed once rather than once
+    per rule. Each is built lazily on first use.
+    """
+    content: str
+    _lines: Optional[List[str]] = field(default=None, init=False, repr=False)
+    _newline_offsets: Optional[List[int]] = field(default=None, init=False, repr=False)
+    _lowered: Optional[str] = field(default=None, init=False, repr=False)
+    
+    @property
+    def lines(self) -> List[str]:
+        """Lines of the file, split on newlines."""
+        if self._lines is None:
+            self._lines = self.content.split('\n')
+        return self._lines
+    
+    @property
+    def newline_offsets(self) -> List[int]:
+        """Character offsets of every newline in the content."""
+        if self._newline_offsets is None:
+            offsets = []
+            offset = -1
+            for line in self.lines[:-1]:
+                offset += len(line) + 1
+                offsets.append(offset)
+            self._newline_offsets = offsets
+        return self._newline_offsets
+    
+    @property
+    def lowered(self) -> str:
+        """The content in lowercase, for case-insensitive substring tests."""
+        if self._lowered is None:
+            self._lowered = self.content.lower()
+        return self._lowered
+    
+    def iter_code_lines(self, line_numbers: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, str, str]]:
+        """
+        Yield (line_number, line, stripped) for each line that is not a comment.
+        
+        Lines are stripped as they are visited, so a pass over the file does
+        not keep a stripped copy of every line.
+        
+        Args:
+            line_numbers: Ascending 1-based line numbers to visit, or None
+                for every line
+        """
+        lines = self.lines
+        if line_numbers is None:
+            line_numbers = range(1, len(lines) + 1)
+        for line_number in line_numbers:
+            line = lines[line_number - 1]
+            stripped = line.strip()
+            if not stripped.startswith('#'):
+                yield line_number, line, stripped
+    
+    def lines_containing(self, needles: Iterable[str]) -> Optional[List[int]]:
+        """
+        Find the lines that contain any of the needles, ignoring case.
+        
+        Each needle is located with str.find over the lowercased content,
+        skipping to the next line after each hit, so lines are never
+        visited one by one in Python.
+        
+        Args:
+            needles: Lowercase substrings, none containing a newline
+        
+        Returns:
+            Ascending 1-based line numbers, or None if lowercasing changed
+            the length of the content so offsets cannot be mapped back
+        """
+        lowered = self.lowered
+        if len(lowered) != len(self.content):
+            return None
+        
+        newline_offsets = self.newline_offsets
+        found = set()
+        for needle in needles:
+            pos = lowered.find(needle)
+            while pos >= 0:
+                line_number = self.line_of(pos)
+                found.add(line_number)
+                if line_number > len(newline_offsets):
+                    break
+                pos = lowered.find(needle, newline_offsets[line_number - 1] + 1)
+        return sorted(found)
+    
+    def lines_matching(self, pattern: Pattern, start: int = 1, end: Optional[int] = None) -> Iterator[int]:
+        """
+        Yield the numbers of the lines on which pattern matches.
+        
+        The pattern is searched over the whole content, once per matching
+        line: after a hit the search resumes at the start of the next line.
+        It must not match across a newline.
+        
+        Args:
+            pattern: Compiled regular expression
+            start: First line to search
+            end: Line to stop before, or None to search to the end
+        """
+        content = self.content
+        newline_offsets = self.newline_offsets
+        if start > len(newline_offsets) + 1:
+            return
+        pos = newline_offsets[start - 2] + 1 if start > 1 else 0
+        if end is None or end > len(newline_offsets) + 1:
+            endpos = len(content)
+        else:
+            endpos = newline_offsets[end - 2] + 1 if end > 1 else 0
+        while True:
+            match = pattern.search(content, pos, endpos)
+            if match is None:
+                return
+            line_number = self.line_of(match.start())
+            yield line_number
+            if line_number > len(newline_offsets):
+                return
+            pos = newline_offsets[line_number - 1] + 1
+    
+    def line_of(self, pos: int) -> int:
+        """Return the 1-based line number containing character offset pos."""
+        return bisect_left(self.newline_offsets, pos) + 1
+    
+    def line_text(self, line_number: int) -> str:
+        """Return the text of a 1-based line number, without its newline."""
+        return self.lines[line_number - 1]
 
 
 class Rule(ABC):
-    """Base class for all rules."""
+    """
+    Base class for all rules.
+    
+    Subclasses define rule_id, name, description, severity and category
+    as plain class attributes, which are read on every violation without
+    a property call. A value that depends on the rule's settings can
+    still be a property.
+    """
+    
+    # Lowercase substrings, at least one of which appears (ignoring case) in
+    # every file this rule can report on. Empty means the rule always runs.
+    needles: Tuple[str, ...] = ()
     
     def __init__(self):
         self.enabled = True
@@ -73,19 +254,47 @@ class Rule(ABC):
         pass
     
     @abstractmethod
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
+    def check_view(self, file_path: str, view: FileView) -> List[RuleViolation]:
         """
         Check the file content for rule violations.
         
         Args:
             file_path: Path to the file being checked
-            content: Content of the file
+            view: Shared view of the file content
             
         Returns:
             List of rule violations found
         """
         pass
     
+    def applies_to(self, view: FileView) -> bool:
+        """
+        Cheaply test whether the file could contain a violation of this rule.
+        
+        Args:
+            view: Shared view of the file content
+        
+        Returns:
+            False if none of the rule's needles occur in the file
+        """
+        if not self.needles:
+            return True
+        lowered = view.lowered
+        return any(needle in lowered for needle in self.needles)
+    
+    def check(self, file_path: str, content: str) -> List[RuleViolation]:
+        """
+        Check raw file content for rule violations.
+        
+        Args:
+            file_path: Path to the file being checked
+            content: Content of the file
+        
+        Returns:
+            List of rule violations found
+        """
+        return self.check_view(file_path, FileView(content))
+    
     def create_violation(
         self,
         file_path: str,
@@ -106,3 +315,142 @@ class Rule(ABC):
             column=column,
             code_snippet=code_snippet
         )
+
+
+class LineRule(Rule):
+    """
+    Base class for rules that judge each line on its own.
+    
+    Line rules implement check_line() instead of check_view(). Because no
+    rule needs state from other lines, the analyzer runs all of them in a
+    single pass over the file (see LineRuleSet). Comment-only lines are
+    never passed to check_line().
+    
+    A line rule's needles must appear on every line it reports, not just
+    somewhere in the file, so by default only the lines containing a needle
+    are checked (see FileView.lines_containing). A rule that can narrow its
+    lines down further, typically by running its pattern over the whole
+    content (see FileView.lines_matching), overrides candidate_lines().
+    """
+    
+    def candidate_lines(self, view: FileView) -> Optional[Iterable[int]]:
+        """
+        Find the lines that could contain a violation of this rule.
+        
+        Args:
+            view: Shared view of the file content
+        
+        Returns:
+            Ascending 1-based line numbers, or None to check every line
+        """
+        if not self.needles:
+            return None
+        return view.lines_containing(self.needles)
+    
+    @abstractmethod
+    def check_line(
+        self,
+        file_path: str,
+        line_number: int,
+        line: str,
+        stripped: str
+    ) -> Optional[RuleViolation]:
+        """
+        Check a single line for a violation of this rule.
+        
+        Args:
+            file_path: Path to the file being checked
+            line_number: 1-based number of the line
+            line: Text of the line, without its newline
+            stripped: The line with surrounding whitespace removed
+        
+        Returns:
+            The violation found on the line, or None
+        """
+        pass
+    
+    def check_view(self, file_path: str, view: FileView) -> List[RuleViolation]:
+        return LineRuleSet([self]).check_view(file_path, view)
+
+
+class LineRuleSet:
+    """
+    Runs line rules together in one pass over the file's lines.
+    
+    Comment lines are skipped, and every other line is stripped once and
+    handed to every rule along with its stripped text, instead of every rule
+    walking and stripping the lines itself. Rules that provide candidate
+    lines are only run on those.
+    """
+    
+    def __init__(self, rules: List[LineRule]):
+        """
+        Initialize the rule set.
+        
+        Args:
+            rules: Line rules to run
+        """
+        self.rules = rules
+    
+    def check(self, file_path: str, content: str) -> List[RuleViolation]:
+        """
+        Check raw file content for violations of all member rules.
+        
+        Args:
+            file_path: Path to the file being checked
+            content: Content of the file
+        
+        Returns:
+            List of rule violations found
+        """
+        return self.check_view(file_path, FileView(content))
+    
+    def check_rules(self, file_path: str, view: FileView) -> Dict[Rule, List[RuleViolation]]:
+        """
+        Check the file content, keeping each rule's violations apart.
+        
+        Args:
+            file_path: Path to the file being checked
+            view: Shared view of the file content
+        
+        Returns:
+            Mapping of each rule to the violations it found
+        """
+        found = {rule: [] for rule in self.rules}
+        
+        # Rules that narrow down their candidate lines only look at those
+        checks = []
+        for rule in self.rules:
+            candidates = rule.candidate_lines(view)
+            if candidates is None:
+                checks.append((rule.check_line, found[rule].append))
+                continue
+            
+            for line_number, line, stripped in view.iter_code_lines(candidates):
+                violation = rule.check_line(file_path, line_number, line, stripped)
+                if violation is not None:
+                    found[rule].append(violation)
+        
+        # The rest share a single pass over every line
+        if checks:
+            for line_number, line, stripped in view.iter_code_lines():
+                for check_line, report in checks:
+                    violation = check_line(file_path, line_number, line, stripped)
+                    if violation is not None:
+                        report(violation)
+        
+        return found
+    
+    def check_view(self, file_path: str, view: FileView) -> List[RuleViolation]:
+        """
+        Check the file content for violations of all member rules.
+        
+        Args:
+            file_path: Path to the file being checked
+            view: Shared view of the file content
+        
+        Returns:
+            List of rule violations found, grouped by rule in the given order
+        """
+        found = self.check_rules(file_path, view)
+        return [violation for rule in self.rules for violation in found[rule]]
@@ -1,213 +1,405 @@
 """Performance rules for GDScript."""
 
 import re
-from typing import List
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional
 
-from .base import Rule, RuleViolation, Severity, RuleCategory
+from .base import FileView, Rule, RuleViolation, Severity, RuleCategory
+
+
+# Patterns are compiled once at import time. The whole-content patterns use
+# [^\S\n] (whitespace other than newline) so a match never spans lines.
+# Patterns that begin with \w+ anchor it with \b: a match can always start
+# at the beginning of a word, and without the anchor the engine retries from
+# every character of a long word, which is quadratic in its length.
+
+# Function and loop headers at the start of a line
+_HEADER_RE = re.compile(
+    r'^[^\S\n]*(?:func[^\S\n]+(?P<func>\w+)[^\S\n]*\(|(?P<loop>for|while)[^\S\n]+(?=\S))',
+    re.MULTILINE
+)
+_PROCESS_FUNCS = ('_process', '_physics_process')
+
+# Per-line patterns
+# get_node(), $Node (identifier required), find_node(), get_tree(), instance()
+_EXPENSIVE_RE = re.compile(
+    r'get_node\s*\(|\$[A-Za-z_]|find_node\s*\(|get_tree\s*\(|instance\s*\('
+)
+_STR_CONCAT_RE = re.compile(r'\b\w+\s*\+=\s*["\']')
+_DOLLAR_NODE_RE = re.compile(r'\$[A-Za-z_]')
+# Lines that can hold a node lookup (get_node() or $Node)
+_NODE_LOOKUP_HINT_RE = re.compile(r'get_node\(|\$')
+
+# Signal connect()/disconnect() calls, told apart by the op group.
+# Key format for signal tracking: "<target_expression>::<signal_literal>"
+_SIGNAL_CALL_RE = re.compile(
+    r'\b(?P<target>\w+(?:\.\w+)*)[^\S\n]*\.(?P<op>connect|disconnect)\([^\S\n]*'
+    r'(?P<signal>"[^"\n]*"|\'[^\'\n]*\')'
+)
+
+
+def _finditer_lines(pattern, view: FileView):
+    """Yield (line_number, match) for each match of pattern over the whole content."""
+    for match in pattern.finditer(view.content):
+        yield view.line_of(match.start()), match
 
 
 class ProcessInLoopRule(Rule):
     """Check for _process() or _physics_process() calls in loops."""
     
-    @property
-    def rule_id(self) -> str:
-        return "P001"
+    rule_id = "P001"
+    name = "Process in Loop"
+    description = "Avoid expensive operations in loops within _process() or _physics_process()"
+    severity = Severity.WARNING
+    category = RuleCategory.PERFORMANCE
+    needles = ('_process',)
     
-    @property
-    def name(self) -> str:
-        return "Process in Loop"
+    def check_view(self, file_path: str, view: FileView) -> List[RuleViolation]:
+        return PerformanceRuleSet([self]).check_view(file_path, view)
+
+
+class StringConcatenationInLoopRule(Rule):
+    """Check for string concatenation in loops."""
     
-    @property
-    def description(self) -> str:
-        return "Avoid expensive operations in loops within _process() or _physics_process()"
+    rule_id = "P002"
+    name = "String Concatenation in Loop"
+    description = "Avoid string concatenation in loops. Use Array.join() or PackedStringArray instead"
+    severity = Severity.WARNING
+    category = RuleCategory.PERFORMANCE
+    needles = ('+=',)
     
-    @property
-    def severity(self) -> Severity:
-        return Severity.WARNING
+    def check_view(self, file_path: str, view: FileView) -> List[RuleViolation]:
+        return PerformanceRuleSet([self]).check_view(file_path, view)
+
+
+class UnusedSignalConnectionRule(Rule):
+    """Check for signals that might not be properly disconnected."""
     
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.PERFORMANCE
+    rule_id = "P003"
+    name = "Signal Not Disconnected"
+    description = "Signals connected with connect() should be disconnected in cleanup to prevent memory leaks"
+    severity = Severity.INFO
+    category = RuleCategory.PERFORMANCE
+    needles = ('.connect(',)
     
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
-        violations = []
-        lines = content.split('\n')
-        
-        in_process_func = False
-        loop_stack = []  # Stack to track loop indentation levels
-        process_line = 0
-        
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            
-            # Check if we're entering a process function
-            if re.match(r'func\s+(_process|_physics_process)\s*\(', stripped):
-                in_process_func = True
-                process_line = i
-                loop_stack = []
-            
-            # Check if we're exiting the function
-            if in_process_func and re.match(r'func\s+\w+\s*\(', stripped) and i != process_line:
-                in_process_func = False
-                loop_stack = []
-            
-            if in_process_func and stripped:
-                # Get current line indentation
-                indent = len(line) - len(line.lstrip())
-                
-                # Remove loops from stack that we've exited (based on indentation)
-                loop_stack = [loop_indent for loop_indent in loop_stack if loop_indent < indent]
-                
-                # Check for loop keywords
-                if re.match(r'(for|while)\s+', stripped):
-                    loop_stack.append(indent)
-                
-                # Check for expensive operations in loops
-                if loop_stack:
-                    # Check for expensive operations
-                    expensive_patterns = [
-                        r'get_node\s*\(',
-                        r'\$[A-Za-z_]',  # $ node reference (more specific)
-                        r'find_node\s*\(',
-                        r'get_tree\s*\(',
-                        r'instance\s*\(',
-                    ]
-                    
-                    for pattern in expensive_patterns:
-                        if re.search(pattern, line):
-                            violations.append(self.create_violation(
-                                file_path=file_path,
-                                line_number=i,
-                                message="Expensive operation in loop within _process() function. Cache results outside the loop",
-                                code_snippet=line.strip()[:50]
-                            ))
-                            break
-        
-        return violations
+    def check_view(self, file_path: str, view: FileView) -> List[RuleViolation]:
+        return PerformanceRuleSet([self]).check_view(file_path, view)
 
 
-class StringConcatenationInLoopRule(Rule):
-    """Check for string concatenation in loops."""
+class GetNodeInProcessRule(Rule):
+    """Check for repeated get_node() calls in _process() functions."""
     
-    @property
-    def rule_id(self) -> str:
-        return "P002"
+    rule_id = "P004"
+    name = "Get Node in Process"
+    description = "Cache node references in _ready() instead of calling get_node() in _process()"
+    severity = Severity.WARNING
+    category = RuleCategory.PERFORMANCE
+    needles = ('_process',)
     
-    @property
-    def name(self) -> str:
-        return "String Concatenation in Loop"
+    def check_view(self, file_path: str, view: FileView) -> List[RuleViolation]:
+        return PerformanceRuleSet([self]).check_view(file_path, view)
+
+
+class PerformanceRuleSet:
+    """
+    Runs the performance rules together over a shared view of the file.
     
-    @property
-    def description(self) -> str:
-        return "Avoid string concatenation in loops. Use Array.join() or PackedStringArray instead"
+    The rules share most of their bookkeeping (function and loop headers,
+    process function boundaries), so it is computed once for all of them
+    instead of once per rule. Each rule's violations are still reported
+    in its own block, in the order the rules were given.
+    """
     
-    @property
-    def severity(self) -> Severity:
-        return Severity.WARNING
+    RULE_TYPES = (
+        ProcessInLoopRule,
+        StringConcatenationInLoopRule,
+        UnusedSignalConnectionRule,
+        GetNodeInProcessRule,
+    )
     
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.PERFORMANCE
+    def __init__(self, rules: List[Rule]):
+        """
+        Initialize the rule set.
+        
+        Args:
+            rules: Performance rules to run (P001-P004)
+        """
+        self.rules = rules
     
     def check(self, file_path: str, content: str) -> List[RuleViolation]:
-        violations = []
-        lines = content.split('\n')
+        """
+        Check raw file content for violations of all member rules.
         
-        in_loop_stack = []  # Stack to track loop indentation levels
+        Args:
+            file_path: Path to the file being checked
+            content: Content of the file
         
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            
-            if stripped:
-                # Get current line indentation
-                indent = len(line) - len(line.lstrip())
-                
-                # Remove loops from stack that we've exited (based on indentation)
-                in_loop_stack = [loop_indent for loop_indent in in_loop_stack if loop_indent < indent]
-                
-                # Check for loop keywords
-                if re.match(r'(for|while)\s+', stripped):
-                    in_loop_stack.append(indent)
-                
-                # Reset loop stack on function definition
-                if re.match(r'func\s+\w+\s*\(', stripped):
-                    in_loop_stack = []
-                
-                if in_loop_stack:
-                    # Check for string concatenation using +=
-                    if re.search(r'\w+\s*\+=\s*["\']', line):
-                        violations.append(self.create_violation(
-                            file_path=file_path,
-                            line_number=i,
-                            message="String concatenation in loop detected. Use Array and join() for better performance",
-                            code_snippet=line.strip()[:50]
-                        ))
+        Returns:
+            List of rule violations found
+        """
+        return self.check_view(file_path, FileView(content))
+    
+    def check_view(self, file_path: str, view: FileView) -> List[RuleViolation]:
+        """
+        Check the file content for violations of all member rules.
+        
+        Args:
+            file_path: Path to the file being checked
+            view: Shared view of the file content
         
+        Returns:
+            List of rule violations found
+        """
+        found = self._check(file_path, view)
+        violations = []
+        for rule_id in found:
+            violations.extend(found[rule_id])
         return violations
-
-
-class UnusedSignalConnectionRule(Rule):
-    """Check for signals that might not be properly disconnected."""
     
-    @property
-    def rule_id(self) -> str:
-        return "P003"
+    def check_rules(self, file_path: str, view: FileView) -> Dict[Rule, List[RuleViolation]]:
+        """
+        Check the file content, keeping each rule's violations apart.
+        
+        Args:
+            file_path: Path to the file being checked
+            view: Shared view of the file content
+        
+        Returns:
+            Mapping of each rule to the violations it found
+        """
+        found = self._check(file_path, view)
+        return {rule: found[rule.rule_id] for rule in self.rules}
+    
+    def _check(self, file_path: str, view: FileView) -> Dict[str, List[RuleViolation]]:
+        """Run the member rules, returning their violations by rule ID in rule order."""
+        active = {rule.rule_id: rule for rule in self.rules}
+        if not active:
+            return {}
+        
+        process_in_loop = active.get("P001")
+        string_concat = active.get("P002")
+        signal_connection = active.get("P003")
+        get_node_in_process = active.get("P004")
+        found = {rule_id: [] for rule_id in active}
+        
+        # Cheap substring tests rule out rules that cannot fire in this file
+        # ('_process' also covers '_physics_process')
+        content = view.content
+        if '_process' not in content:
+            process_in_loop = get_node_in_process = None
+        elif 'get_node(' not in content and '$' not in content:
+            get_node_in_process = None
+        if '+=' not in content:
+            string_concat = None
+        if '.connect(' not in content:
+            signal_connection = None
+        
+        if process_in_loop or string_concat or get_node_in_process:
+            self._check_lines(
+                file_path, view, found,
+                process_in_loop, string_concat, get_node_in_process
+            )
+        
+        if signal_connection:
+            found["P003"] = self._check_signals(signal_connection, file_path, view)
+        
+        return found
     
-    @property
-    def name(self) -> str:
-        return "Signal Not Disconnected"
+    def _check_lines(
+        self,
+        file_path: str,
+        view: FileView,
+        found: Dict[str, List[RuleViolation]],
+        process_in_loop: Optional[Rule],
+        string_concat: Optional[Rule],
+        get_node_in_process: Optional[Rule]
+    ):
+        """
+        Run the line-structure rules (P001, P002, P004).
+        
+        One scan of the whole content finds every function and loop header,
+        and from those one walk finds the lines inside loops. P001 and P002
+        then only visit lines inside loops, and P004 only the lines of
+        process functions that mention get_node( or $. Everything else is
+        skipped without being looked at in Python.
+        """
+        func_lines = {}  # line number -> function name
+        loop_lines = []
+        for line_number, match in _finditer_lines(_HEADER_RE, view):
+            if match.group('loop'):
+                loop_lines.append(line_number)
+            else:
+                func_lines[line_number] = match.group('func')
+        
+        loop_body = []
+        if loop_lines and (process_in_loop or string_concat):
+            loop_body = self._loop_body_lines(view, func_lines, loop_lines)
+        
+        if process_in_loop or get_node_in_process:
+            func_starts = list(func_lines)
+            for index, start in enumerate(func_starts):
+                if func_lines[start] not in _PROCESS_FUNCS:
+                    continue
+                # A process function runs until the next function header
+                if index + 1 < len(func_starts):
+                    end = func_starts[index + 1]
+                else:
+                    end = len(view.lines) + 1
+                
+                if process_in_loop:
+                    in_loops = loop_body[bisect_left(loop_body, start):bisect_left(loop_body, end)]
+                    self._check_process_loops(file_path, view, found, in_loops, process_in_loop)
+                if get_node_in_process:
+                    self._check_get_node(file_path, view, found, start, end, get_node_in_process)
+        
+        if string_concat and loop_body:
+            self._check_concatenation(file_path, view, found, loop_body, string_concat)
     
-    @property
-    def description(self) -> str:
-        return "Signals connected with connect() should be disconnected in cleanup to prevent memory leaks"
+    @staticmethod
+    def _loop_body_lines(view: FileView, func_lines: Dict[int, str], loop_lines: List[int]) -> List[int]:
+        """
+        Find the non-blank lines inside loops, in ascending order.
+        
+        A loop ends at the first non-blank line indented no deeper than its
+        header, or at a function header. Outside any loop the stack of open
+        loops stays empty, so the walk jumps from one loop header to the
+        next loop that is not already covered. Only the lines it visits are
+        measured, so code outside loops is never looked at.
+        """
+        lines = view.lines
+        loop_set = set(loop_lines)
+        line_count = len(lines)
+        body = []
+        
+        next_loop = 0
+        while next_loop < len(loop_lines):
+            loop_stack = []  # Stack to track loop indentation levels
+            i = loop_lines[next_loop]
+            while i <= line_count:
+                line = lines[i - 1]
+                code = line.lstrip()
+                if code:
+                    indent = len(line) - len(code)
+                    
+                    # Remove loops from stack that we've exited (based on indentation);
+                    # the stack is strictly increasing, so pop from the top in place
+                    while loop_stack and loop_stack[-1] >= indent:
+                        loop_stack.pop()
+                    if i in loop_set:
+                        loop_stack.append(indent)
+                    
+                    # Reset loop stack on function definition
+                    if i in func_lines:
+                        loop_stack.clear()
+                    
+                    if not loop_stack:
+                        break
+                    body.append(i)
+                
+                i += 1
+            
+            next_loop = bisect_right(loop_lines, i)
+        
+        return body
     
-    @property
-    def severity(self) -> Severity:
-        return Severity.INFO
+    def _check_process_loops(
+        self,
+        file_path: str,
+        view: FileView,
+        found: Dict[str, List[RuleViolation]],
+        in_loops: List[int],
+        process_in_loop: Rule
+    ):
+        """Check the lines inside loops of a process function for expensive calls (P001)."""
+        lines = view.lines
+        for i in in_loops:
+            line = lines[i - 1]
+            # Every pattern but $Node needs a '(', so most lines skip the regex
+            if ('(' in line or '$' in line) and _EXPENSIVE_RE.search(line):
+                found["P001"].append(process_in_loop.create_violation(
+                    file_path=file_path,
+                    line_number=i,
+                    message="Expensive operation in loop within _process() function. Cache results outside the loop",
+                    code_snippet=line.strip()[:50]
+                ))
     
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.PERFORMANCE
+    def _check_get_node(
+        self,
+        file_path: str,
+        view: FileView,
+        found: Dict[str, List[RuleViolation]],
+        start: int,
+        end: int,
+        get_node_in_process: Rule
+    ):
+        """Check lines start..end-1 of a process function for node lookups (P004)."""
+        lines = view.lines
+        for i in view.lines_matching(_NODE_LOOKUP_HINT_RE, start, end):
+            line = lines[i - 1]
+            # Check for get_node calls or $ syntax (but not in signal context)
+            if 'get_node(' in line or (
+                _DOLLAR_NODE_RE.search(line) and 'signal' not in line.lower()
+            ):
+                found["P004"].append(get_node_in_process.create_violation(
+                    file_path=file_path,
+                    line_number=i,
+                    message="get_node() or $ called in _process(). Cache the reference in _ready() for better performance",
+                    code_snippet=line.strip()[:50]
+                ))
     
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
+    def _check_concatenation(
+        self,
+        file_path: str,
+        view: FileView,
+        found: Dict[str, List[RuleViolation]],
+        in_loops: List[int],
+        string_concat: Rule
+    ):
+        """Check the lines inside loops for string concatenation (P002)."""
+        lines = view.lines
+        for i in in_loops:
+            line = lines[i - 1]
+            # Check for string concatenation using +=, with literal
+            # tests first so most lines skip the regex
+            if '+=' in line and ('"' in line or "'" in line) and _STR_CONCAT_RE.search(line):
+                found["P002"].append(string_concat.create_violation(
+                    file_path=file_path,
+                    line_number=i,
+                    message="String concatenation in loop detected. Use Array and join() for better performance",
+                    code_snippet=line.strip()[:50]
+                ))
+    
+    def _check_signals(
+        self,
+        rule: Rule,
+        file_path: str,
+        view: FileView
+    ) -> List[RuleViolation]:
+        """Report signals that are connected but never disconnected (P003)."""
         violations = []
-        lines = content.split('\n')
+        lines = view.lines
         
-        # Track individual signal connections and disconnections.
-        # Key format: "<target_expression>::<signal_literal>"
-        connect_pattern = re.compile(
-            r'(?P<target>\w+(?:\.\w+)*)\s*\.connect\(\s*(?P<signal>"[^"]*"|\'[^\']*\')'
-        )
-        disconnect_pattern = re.compile(
-            r'(?P<target>\w+(?:\.\w+)*)\s*\.disconnect\(\s*(?P<signal>"[^"]*"|\'[^\']*\')'
-        )
+        # "<target_expression>::<signal_literal>" -> first line connected
+        connected_signals = {}
+        disconnected_signals = set()
         
-        connected_signals = {}  # key -> first line number where connected
-        disconnected_signals = set()  # set of keys that are disconnected
-        
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            
-            # Ignore comments entirely
-            if stripped.startswith('#'):
+        # Signal calls don't depend on surrounding structure, so the whole
+        # content is scanned at once for both kinds of call; matches on
+        # comment lines are ignored
+        for line_num, match in _finditer_lines(_SIGNAL_CALL_RE, view):
+            if lines[line_num - 1].lstrip().startswith('#'):
                 continue
-            
-            # Find all connect calls on this line
-            for match in connect_pattern.finditer(line):
-                key = f"{match.group('target')}::{match.group('signal')}"
-                # Only store the first occurrence line for reporting
-                if key not in connected_signals:
-                    connected_signals[key] = i
-            
-            # Find all disconnect calls on this line
-            for match in disconnect_pattern.finditer(line):
-                key = f"{match.group('target')}::{match.group('signal')}"
+            key = f"{match.group('target')}::{match.group('signal')}"
+            if match.group('op') == 'disconnect':
                 disconnected_signals.add(key)
+            # Only store the first occurrence line for reporting
+            elif key not in connected_signals:
+                connected_signals[key] = line_num
         
         # Report any signals that are connected but never disconnected
         for key, line_num in connected_signals.items():
             if key not in disconnected_signals:
-                violations.append(self.create_violation(
+                violations.append(rule.create_violation(
                     file_path=file_path,
                     line_number=line_num,
                     message="Signal connected but no matching disconnect() found. Consider disconnecting in _exit_tree() to prevent memory leaks",
@@ -215,58 +407,3 @@ class UnusedSignalConnectionRule(Rule):
                 ))
         
         return violations
-
-
-class GetNodeInProcessRule(Rule):
-    """Check for repeated get_node() calls in _process() functions."""
-    
-    @property
-    def rule_id(self) -> str:
-        return "P004"
-    
-    @property
-    def name(self) -> str:
-        return "Get Node in Process"
-    
-    @property
-    def description(self) -> str:
-        return "Cache node references in _ready() instead of calling get_node() in _process()"
-    
-    @property
-    def severity(self) -> Severity:
-        return Severity.WARNING
-    
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.PERFORMANCE
-    
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
-        violations = []
-        lines = content.split('\n')
-        
-        in_process_func = False
-        process_line = 0
-        
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            
-            # Check if we're entering a process function
-            if re.match(r'func\s+(_process|_physics_process)\s*\(', stripped):
-                in_process_func = True
-                process_line = i
-            
-            # Check if we're exiting the function
-            if in_process_func and re.match(r'func\s+\w+\s*\(', stripped) and i != process_line:
-                in_process_func = False
-            
-            if in_process_func:
-                # Check for get_node calls or $ syntax (but not in signal context)
-                if 'get_node(' in line or (re.search(r'\$[A-Za-z_]', line) and 'signal' not in line.lower()):
-                    violations.append(self.create_violation(
-                        file_path=file_path,
-                        line_number=i,
-                        message="get_node() or $ called in _process(). Cache the reference in _ready() for better performance",
-                        code_snippet=line.strip()[:50]
-                    ))
-        
-        return violations
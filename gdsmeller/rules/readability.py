@@ -1,114 +1,107 @@
 """Readability rules for GDScript."""
 
 import re
-from typing import List
+from itertools import compress, count
+from typing import Iterable, List, Optional
 
-from .base import Rule, RuleViolation, Severity, RuleCategory
+from .base import FileView, LineRule, Rule, RuleViolation, Severity, RuleCategory
 
 
-class LineTooLongRule(Rule):
+# Patterns are compiled once at import time rather than on every check.
+# Class and function headers are found with one search over the whole
+# content; [^\S\n] (whitespace other than newline) keeps a match on one line.
+_CLASS_RE = re.compile(r'^[^\S\n]*class[^\S\n]+(\w+)', re.MULTILINE)
+# Public functions only (not starting with _)
+_PUBLIC_FUNC_RE = re.compile(r'^[^\S\n]*func[^\S\n]+([a-zA-Z][a-zA-Z0-9_]*)[^\S\n]*\(', re.MULTILINE)
+# A line whose leading whitespace contains a tab / a space. They start at the
+# preceding newline rather than a MULTILINE ^, which lets the engine jump
+# between newlines instead of trying every position. The whitespace before
+# the tab (space) excludes that character, so the run is consumed greedily
+# in one step with nothing to backtrack over.
+_TAB_INDENT_RE = re.compile(r'\n[^\S\n\t]*\t')
+_SPACE_INDENT_RE = re.compile(r'\n[^\S\n ]* ')
+_NON_SPACE_RE = re.compile(r'\S')
+
+
+def _find_indent(pattern, content: str) -> Optional[int]:
+    """Return the offset of the first line matching an indent pattern, or None."""
+    # The first line has no preceding newline, so test it on its own
+    end = content.find('\n')
+    first_line = content if end < 0 else content[:end]
+    if pattern.match('\n' + first_line):
+        return 0
+    match = pattern.search(content)
+    return match.start() + 1 if match else None
+
+
+def _has_docstring(content: str, header_end: int) -> bool:
+    """Return whether the next non-blank line after a header is a comment."""
+    # Blank lines are all whitespace, so the first non-whitespace character
+    # after the header's line is the start of the next non-blank line
+    newline = content.find('\n', header_end)
+    if newline < 0:
+        return False
+    match = _NON_SPACE_RE.search(content, newline)
+    return match is not None and match.group() == '#'
+
+
+class LineTooLongRule(LineRule):
     """Check for lines that are too long."""
     
+    rule_id = "R001"
+    name = "Line Too Long"
+    severity = Severity.WARNING
+    category = RuleCategory.READABILITY
+    
     def __init__(self, max_length: int = 100):
         super().__init__()
         self.max_length = max_length
     
-    @property
-    def rule_id(self) -> str:
-        return "R001"
-    
-    @property
-    def name(self) -> str:
-        return "Line Too Long"
-    
     @property
     def description(self) -> str:
         return f"Lines should not exceed {self.max_length} characters"
     
-    @property
-    def severity(self) -> Severity:
-        return Severity.WARNING
-    
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.READABILITY
-    
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
-        violations = []
-        lines = content.split('\n')
-        
-        for i, line in enumerate(lines, 1):
-            # Skip comment-only lines as they might contain long URLs
-            stripped = line.strip()
-            if stripped.startswith('#'):
-                continue
-            
-            if len(line) > self.max_length:
-                violations.append(self.create_violation(
-                    file_path=file_path,
-                    line_number=i,
-                    message=f"Line exceeds {self.max_length} characters (found {len(line)})",
-                    code_snippet=line[:50] + "..." if len(line) > 50 else line
-                ))
-        
-        return violations
+    def candidate_lines(self, view: FileView) -> Iterable[int]:
+        # The length test for every line runs in C; Python only sees the long ones
+        too_long = map(self.max_length.__lt__, map(len, view.lines))
+        return compress(count(1), too_long)
+    
+    def check_line(self, file_path: str, line_number: int, line: str, stripped: str) -> Optional[RuleViolation]:
+        # Comment-only lines, which might contain long URLs, are never passed in
+        if len(line) > self.max_length:
+            return self.create_violation(
+                file_path=file_path,
+                line_number=line_number,
+                message=f"Line exceeds {self.max_length} characters (found {len(line)})",
+                code_snippet=line[:50] + "..." if len(line) > 50 else line
+            )
+        return None
 
 
 class MissingClassDocstringRule(Rule):
     """Check for classes without docstrings."""
     
-    @property
-    def rule_id(self) -> str:
-        return "R002"
-    
-    @property
-    def name(self) -> str:
-        return "Missing Class Docstring"
-    
-    @property
-    def description(self) -> str:
-        return "Classes should have docstrings"
-    
-    @property
-    def severity(self) -> Severity:
-        return Severity.INFO
-    
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.READABILITY
+    rule_id = "R002"
+    name = "Missing Class Docstring"
+    description = "Classes should have docstrings"
+    severity = Severity.INFO
+    category = RuleCategory.READABILITY
+    needles = ('class',)
     
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
+    def check_view(self, file_path: str, view: FileView) -> List[RuleViolation]:
         violations = []
-        lines = content.split('\n')
+        content = view.content
         
-        class_pattern = re.compile(r'^\s*class\s+(\w+)')
-        comment_pattern = re.compile(r'^\s*#')
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            match = class_pattern.match(line)
-            
-            if match:
-                class_name = match.group(1)
-                # Check if next non-empty line is a comment
-                has_docstring = False
-                j = i + 1
-                while j < len(lines) and not lines[j].strip():
-                    j += 1
-                
-                if j < len(lines) and comment_pattern.match(lines[j]):
-                    has_docstring = True
-                
-                if not has_docstring:
-                    violations.append(self.create_violation(
-                        file_path=file_path,
-                        line_number=i + 1,
-                        message=f"Class '{class_name}' is missing a docstring",
-                        code_snippet=line.strip()
-                    ))
-            
-            i += 1
+        for match in _CLASS_RE.finditer(content):
+            # Check if next non-empty line is a comment
+            if not _has_docstring(content, match.end()):
+                line_number = view.line_of(match.start())
+                violations.append(self.create_violation(
+                    file_path=file_path,
+                    line_number=line_number,
+                    message=f"Class '{match.group(1)}' is missing a docstring",
+                    code_snippet=view.line_text(line_number).strip()
+                ))
         
         return violations
 
@@ -116,60 +109,27 @@ class MissingClassDocstringRule(Rule):
 class MissingFunctionDocstringRule(Rule):
     """Check for functions without docstrings."""
     
-    @property
-    def rule_id(self) -> str:
-        return "R003"
-    
-    @property
-    def name(self) -> str:
-        return "Missing Function Docstring"
-    
-    @property
-    def description(self) -> str:
-        return "Public functions should have docstrings"
-    
-    @property
-    def severity(self) -> Severity:
-        return Severity.INFO
+    rule_id = "R003"
+    name = "Missing Function Docstring"
+    description = "Public functions should have docstrings"
+    severity = Severity.INFO
+    category = RuleCategory.READABILITY
+    needles = ('func',)
     
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.READABILITY
-    
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
+    def check_view(self, file_path: str, view: FileView) -> List[RuleViolation]:
         violations = []
-        lines = content.split('\n')
+        content = view.content
         
-        # Match public functions (not starting with _)
-        func_pattern = re.compile(r'^\s*func\s+([a-zA-Z][a-zA-Z0-9_]*)\s*\(')
-        comment_pattern = re.compile(r'^\s*#')
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            match = func_pattern.match(line)
-            
-            if match:
-                func_name = match.group(1)
-                
-                # Check if next non-empty line is a comment
-                has_docstring = False
-                j = i + 1
-                while j < len(lines) and not lines[j].strip():
-                    j += 1
-                
-                if j < len(lines) and comment_pattern.match(lines[j]):
-                    has_docstring = True
-                
-                if not has_docstring:
-                    violations.append(self.create_violation(
-                        file_path=file_path,
-                        line_number=i + 1,
-                        message=f"Function '{func_name}' is missing a docstring",
-                        code_snippet=line.strip()
-                    ))
-            
-            i += 1
+        for match in _PUBLIC_FUNC_RE.finditer(content):
+            # Check if next non-empty line is a comment
+            if not _has_docstring(content, match.end()):
+                line_number = view.line_of(match.start())
+                violations.append(self.create_violation(
+                    file_path=file_path,
+                    line_number=line_number,
+                    message=f"Function '{match.group(1)}' is missing a docstring",
+                    code_snippet=view.line_text(line_number).strip()
+                ))
         
         return violations
 
@@ -177,53 +137,29 @@ class MissingFunctionDocstringRule(Rule):
 class InconsistentIndentationRule(Rule):
     """Check for inconsistent indentation (mixing tabs and spaces)."""
     
-    @property
-    def rule_id(self) -> str:
-        return "R004"
-    
-    @property
-    def name(self) -> str:
-        return "Inconsistent Indentation"
-    
-    @property
-    def description(self) -> str:
-        return "Indentation should be consistent (tabs or spaces, not mixed)"
-    
-    @property
-    def severity(self) -> Severity:
-        return Severity.ERROR
-    
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.READABILITY
+    rule_id = "R004"
+    name = "Inconsistent Indentation"
+    description = "Indentation should be consistent (tabs or spaces, not mixed)"
+    severity = Severity.ERROR
+    category = RuleCategory.READABILITY
+    needles = ('\t',)
     
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
+    def check_view(self, file_path: str, view: FileView) -> List[RuleViolation]:
         violations = []
-        lines = content.split('\n')
         
-        uses_tabs = False
-        uses_spaces = False
-        
-        for i, line in enumerate(lines, 1):
-            if not line or not line[0].isspace():
-                continue
-            
-            # Check leading whitespace
-            leading = len(line) - len(line.lstrip())
-            if leading > 0:
-                if '\t' in line[:leading]:
-                    uses_tabs = True
-                if ' ' in line[:leading]:
-                    uses_spaces = True
-            
-            # If both are used, it's inconsistent
-            if uses_tabs and uses_spaces:
-                violations.append(self.create_violation(
-                    file_path=file_path,
-                    line_number=i,
-                    message="Mixing tabs and spaces for indentation",
-                    code_snippet=line[:30]
-                ))
-                break
+        # Tabs and spaces are "mixed" from the first line by which both have
+        # appeared in some line's indentation, i.e. the later of the first
+        # tab-indented and the first space-indented line. Both searches run
+        # over the whole content in C and stop at their first hit.
+        tab = _find_indent(_TAB_INDENT_RE, view.content)
+        space = None if tab is None else _find_indent(_SPACE_INDENT_RE, view.content)
+        if space is not None:
+            line_number = view.line_of(max(tab, space))
+            violations.append(self.create_violation(
+                file_path=file_path,
+                line_number=line_number,
+                message="Mixing tabs and spaces for indentation",
+                code_snippet=view.line_text(line_number)[:30]
+            ))
         
         return violations
@@ -1,228 +1,157 @@
 """Security rules for GDScript."""
 
 import re
-from typing import List
+from typing import Iterable, Optional
 
-from .base import Rule, RuleViolation, Severity, RuleCategory
+from .base import FileView, LineRule, RuleViolation, Severity, RuleCategory
 
 
-class HardcodedPasswordRule(Rule):
+# Patterns are compiled once at import time rather than on every check.
+# Related patterns are fused into one alternation so each line is scanned
+# once per rule rather than once per pattern. Most lines cannot match, so
+# each rule tests for a literal the pattern needs before running it.
+
+# Password assignments
+_PASSWORD_RE = re.compile(r'(?:password|passwd|pwd)\s*=\s*["\'](.+)["\']', re.IGNORECASE)
+
+# Values that are obviously placeholders rather than real passwords
+_PLACEHOLDER_PASSWORDS = frozenset({
+    'password',
+    'your_password',
+    'your_password_here',
+    'changeme',
+    'test',
+    'admin',
+    '12345',
+    '123456',
+    'qwerty',
+})
+
+# Potentially unsafe eval/execute
+_UNSAFE_EVAL_RE = re.compile(r'Expression\.parse\s*\(|\bExpression\s*\.\s*execute\s*\(')
+# Looser form of the above that starts with a literal, which lets the regex
+# engine jump between occurrences of "Expression" when searching a whole file;
+# [^\S\n] (whitespace other than newline) keeps a match on one line
+_UNSAFE_EVAL_HINT_RE = re.compile(r'Expression[^\S\n]*\.[^\S\n]*(?:parse|execute)[^\S\n]*\(')
+
+# SQL string concatenation. More specific to avoid false positives with
+# arithmetic but catch variable concatenation
+_SQL_CONCAT_RE = re.compile(
+    r'(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE).*?(%s|%d|\+\s*["\']|\+\s+\w+)',
+    re.IGNORECASE
+)
+
+_RANDOM_CALL_RE = re.compile(r'\b(randi|randf|rand_range)\s*\(')
+
+# Security-related contexts where weak random must not be used
+_SECURITY_KEYWORD_RE = re.compile(r'token|key|password|secret|salt|nonce|session', re.IGNORECASE)
+
+
+class HardcodedPasswordRule(LineRule):
     """Check for hardcoded passwords in the code."""
     
-    @property
-    def rule_id(self) -> str:
-        return "S001"
-    
-    @property
-    def name(self) -> str:
-        return "Hardcoded Password"
-    
-    @property
-    def description(self) -> str:
-        return "Avoid hardcoding passwords in the code"
-    
-    @property
-    def severity(self) -> Severity:
-        return Severity.ERROR
-    
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.SECURITY
-    
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
-        violations = []
-        lines = content.split('\n')
-        
-        # Pattern to detect password assignments
-        password_patterns = [
-            re.compile(r'password\s*=\s*["\'](.+)["\']', re.IGNORECASE),
-            re.compile(r'passwd\s*=\s*["\'](.+)["\']', re.IGNORECASE),
-            re.compile(r'pwd\s*=\s*["\'](.+)["\']', re.IGNORECASE),
-        ]
-        
-        for i, line in enumerate(lines, 1):
-            # Skip comments
-            if line.strip().startswith('#'):
-                continue
-            
-            for pattern in password_patterns:
-                match = pattern.search(line)
-                if match:
-                    password_value = match.group(1)
-                    # Skip if it's empty or looks like a placeholder
-                    if password_value:
-                        normalized_password = password_value.strip().lower()
-                        placeholder_passwords = {
-                            'password',
-                            'your_password',
-                            'your_password_here',
-                            'changeme',
-                            'test',
-                            'admin',
-                            '12345',
-                            '123456',
-                            'qwerty',
-                        }
-                        if normalized_password not in placeholder_passwords:
-                            violations.append(self.create_violation(
-                                file_path=file_path,
-                                line_number=i,
-                                message="Hardcoded password detected. Use environment variables or secure storage instead",
-                                code_snippet=line.strip()[:50]
-                            ))
-                            break
+    rule_id = "S001"
+    name = "Hardcoded Password"
+    description = "Avoid hardcoding passwords in the code"
+    severity = Severity.ERROR
+    category = RuleCategory.SECURITY
+    needles = ('passw', 'pwd')
+    
+    def check_line(self, file_path: str, line_number: int, line: str, stripped: str) -> Optional[RuleViolation]:
+        # Reject most lines with literal tests before lowering or matching
+        if '=' not in line:
+            return None
+        lower_line = line.lower()
+        if 'passw' not in lower_line and 'pwd' not in lower_line:
+            return None
         
-        return violations
+        match = _PASSWORD_RE.search(line)
+        # Skip if it's empty or looks like a placeholder
+        if match and match.group(1).strip().lower() not in _PLACEHOLDER_PASSWORDS:
+            return self.create_violation(
+                file_path=file_path,
+                line_number=line_number,
+                message="Hardcoded password detected. Use environment variables or secure storage instead",
+                code_snippet=stripped[:50]
+            )
+        return None
 
 
-class UnsafeEvalRule(Rule):
+class UnsafeEvalRule(LineRule):
     """Check for use of unsafe eval or execute functions."""
     
-    @property
-    def rule_id(self) -> str:
-        return "S002"
-    
-    @property
-    def name(self) -> str:
-        return "Unsafe Eval/Execute"
-    
-    @property
-    def description(self) -> str:
-        return "Avoid using Expression.parse() or execute() with untrusted input"
-    
-    @property
-    def severity(self) -> Severity:
-        return Severity.WARNING
-    
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.SECURITY
-    
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
-        violations = []
-        lines = content.split('\n')
-        
-        # Patterns to detect potentially unsafe eval/execute
-        unsafe_patterns = [
-            re.compile(r'Expression\.parse\s*\('),
-            re.compile(r'\bExpression\s*\.\s*execute\s*\('),
-        ]
-        
-        for i, line in enumerate(lines, 1):
-            # Skip comments
-            if line.strip().startswith('#'):
-                continue
-            
-            for pattern in unsafe_patterns:
-                if pattern.search(line):
-                    violations.append(self.create_violation(
-                        file_path=file_path,
-                        line_number=i,
-                        message="Potentially unsafe use of Expression.parse() or execute(). Ensure input is sanitized",
-                        code_snippet=line.strip()[:50]
-                    ))
-                    break
-        
-        return violations
+    rule_id = "S002"
+    name = "Unsafe Eval/Execute"
+    description = "Avoid using Expression.parse() or execute() with untrusted input"
+    severity = Severity.WARNING
+    category = RuleCategory.SECURITY
+    needles = ('expression',)
+    
+    def candidate_lines(self, view: FileView) -> Iterable[int]:
+        # Lines are confirmed against the exact pattern in check_line
+        return view.lines_matching(_UNSAFE_EVAL_HINT_RE)
+    
+    def check_line(self, file_path: str, line_number: int, line: str, stripped: str) -> Optional[RuleViolation]:
+        if _UNSAFE_EVAL_RE.search(line):
+            return self.create_violation(
+                file_path=file_path,
+                line_number=line_number,
+                message="Potentially unsafe use of Expression.parse() or execute(). Ensure input is sanitized",
+                code_snippet=stripped[:50]
+            )
+        return None
 
 
-class SQLInjectionRiskRule(Rule):
+class SQLInjectionRiskRule(LineRule):
     """Check for potential SQL injection vulnerabilities."""
     
-    @property
-    def rule_id(self) -> str:
-        return "S003"
-    
-    @property
-    def name(self) -> str:
-        return "SQL Injection Risk"
-    
-    @property
-    def description(self) -> str:
-        return "Avoid string concatenation in SQL queries"
-    
-    @property
-    def severity(self) -> Severity:
-        return Severity.ERROR
-    
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.SECURITY
-    
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
-        violations = []
-        lines = content.split('\n')
-        
-        # Pattern to detect SQL string concatenation
-        # More specific to avoid false positives with arithmetic but catch variable concatenation
-        sql_concat_pattern = re.compile(
-            r'(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE).*?(%s|%d|\+\s*["\']|\+\s+\w+)',
-            re.IGNORECASE
-        )
+    rule_id = "S003"
+    name = "SQL Injection Risk"
+    description = "Avoid string concatenation in SQL queries"
+    severity = Severity.ERROR
+    category = RuleCategory.SECURITY
+    needles = ('select', 'insert', 'update', 'delete', 'drop', 'create')
+    
+    def check_line(self, file_path: str, line_number: int, line: str, stripped: str) -> Optional[RuleViolation]:
+        # The pattern needs a '+' or a '%' format after the keyword
+        if '+' not in line and '%' not in line:
+            return None
+        lower_line = line.lower()
+        if not (
+            'select' in lower_line or 'insert' in lower_line or 'update' in lower_line
+            or 'delete' in lower_line or 'drop' in lower_line or 'create' in lower_line
+        ):
+            return None
         
-        for i, line in enumerate(lines, 1):
-            # Skip comments
-            if line.strip().startswith('#'):
-                continue
-            
-            # Check if line contains SQL keywords with potential concatenation
-            if sql_concat_pattern.search(line):
-                violations.append(self.create_violation(
-                    file_path=file_path,
-                    line_number=i,
-                    message="Potential SQL injection risk. Use parameterized queries instead of string concatenation",
-                    code_snippet=line.strip()[:50]
-                ))
-        
-        return violations
+        # Check if line contains SQL keywords with potential concatenation
+        if _SQL_CONCAT_RE.search(line):
+            return self.create_violation(
+                file_path=file_path,
+                line_number=line_number,
+                message="Potential SQL injection risk. Use parameterized queries instead of string concatenation",
+                code_snippet=stripped[:50]
+            )
+        return None
 
 
-class InsecureRandomRule(Rule):
+class InsecureRandomRule(LineRule):
     """Check for use of insecure random number generation for security purposes."""
     
-    @property
-    def rule_id(self) -> str:
-        return "S004"
-    
-    @property
-    def name(self) -> str:
-        return "Insecure Random"
-    
-    @property
-    def description(self) -> str:
-        return "Use Crypto.generate_random_bytes() for security-critical randomness, not randi()/randf()"
-    
-    @property
-    def severity(self) -> Severity:
-        return Severity.WARNING
-    
-    @property
-    def category(self) -> RuleCategory:
-        return RuleCategory.SECURITY
-    
-    def check(self, file_path: str, content: str) -> List[RuleViolation]:
-        violations = []
-        lines = content.split('\n')
-        
-        # Look for security-related contexts using weak random
-        security_keywords = ['token', 'key', 'password', 'secret', 'salt', 'nonce', 'session']
-        random_functions = re.compile(r'\b(randi|randf|rand_range)\s*\(')
-        
-        for i, line in enumerate(lines, 1):
-            # Skip comments
-            if line.strip().startswith('#'):
-                continue
-            
-            lower_line = line.lower()
-            
-            # Check if line uses weak random and contains security keywords
-            if random_functions.search(line):
-                if any(keyword in lower_line for keyword in security_keywords):
-                    violations.append(self.create_violation(
-                        file_path=file_path,
-                        line_number=i,
-                        message="Using insecure random function for security-critical purpose. Use Crypto.generate_random_bytes() instead",
-                        code_snippet=line.strip()[:50]
-                    ))
-        
-        return violations
+    rule_id = "S004"
+    name = "Insecure Random"
+    description = "Use Crypto.generate_random_bytes() for security-critical randomness, not randi()/randf()"
+    severity = Severity.WARNING
+    category = RuleCategory.SECURITY
+    # The called names themselves: 'rand' alone also matches random, operand, brand...
+    needles = ('randi', 'randf', 'rand_range')
+    
+    def check_line(self, file_path: str, line_number: int, line: str, stripped: str) -> Optional[RuleViolation]:
+        # Check if line uses weak random and contains security keywords
+        if 'rand' in line and _RANDOM_CALL_RE.search(line) and _SECURITY_KEYWORD_RE.search(line):
+            return self.create_violation(
+                file_path=file_path,
+                line_number=line_number,
+                message="Using insecure random function for security-critical purpose. Use Crypto.generate_random_bytes() instead",
+                code_snippet=stripped[:50]
+            )
+        return None
@@ -1,7 +1,10 @@
 """Tests for individual rules."""
 
+import pickle
+import re
 import unittest
 
+from gdsmeller.rules.base import FileView, LineRuleSet
 from gdsmeller.rules.readability import (
     LineTooLongRule, MissingClassDocstringRule,
     MissingFunctionDocstringRule, InconsistentIndentationRule
@@ -12,10 +15,67 @@ from gdsmeller.rules.security import (
 )
 from gdsmeller.rules.performance import (
     ProcessInLoopRule, StringConcatenationInLoopRule,
-    UnusedSignalConnectionRule, GetNodeInProcessRule
+    UnusedSignalConnectionRule, GetNodeInProcessRule, PerformanceRuleSet
 )
 
 
+class TestFileView(unittest.TestCase):
+    """Test the shared file view."""
+    
+    def test_line_lookup(self):
+        """Test mapping offsets to lines and back."""
+        view = FileView("extends Node\n\nfunc _ready():\n\tpass")
+        
+        self.assertEqual(view.line_of(0), 1)
+        self.assertEqual(view.line_of(12), 1)  # the newline ending line 1
+        self.assertEqual(view.line_of(13), 2)
+        self.assertEqual(view.line_of(view.content.index("pass")), 4)
+        self.assertEqual(view.line_text(3), "func _ready():")
+        self.assertEqual(view.line_text(4), "\tpass")
+    
+    def test_lines_matching(self):
+        """Test finding the lines a pattern matches on, once per line."""
+        view = FileView("get_node(a); get_node(b)\npass\nget_node(c)")
+        pattern = re.compile(r'get_node\(')
+        
+        self.assertEqual(list(view.lines_matching(pattern)), [1, 3])
+        self.assertEqual(list(view.lines_matching(pattern, 2)), [3])
+        self.assertEqual(list(view.lines_matching(pattern, 1, 3)), [1])
+
+    def test_lines_containing(self):
+        """Test finding the lines that contain a needle, ignoring case."""
+        view = FileView("var PWD = 1\npass\nvar pwd = pwd\n# Password")
+        
+        self.assertEqual(view.lines_containing(('pwd', 'passw')), [1, 3, 4])
+        self.assertEqual(view.lines_containing(('secret',)), [])
+    
+    def test_rule_needles(self):
+        """Test that needles are matched ignoring case."""
+        view = FileView('var PassWord = "hunter2"\n')
+        
+        self.assertTrue(HardcodedPasswordRule().applies_to(view))
+        self.assertFalse(UnsafeEvalRule().applies_to(view))
+        self.assertTrue(LineTooLongRule().applies_to(view))  # no needles
+
+
+class TestRuleViolation(unittest.TestCase):
+    """Test rule violations."""
+    
+    def test_pickle_shares_strings(self):
+        """Test that unpickled violations are equal and share their repeated strings."""
+        rule = HardcodedPasswordRule()
+        violations = [
+            rule.create_violation(file_path="".join(["scripts/", "player.gd"]), line_number=i, message="Hardcoded")
+            for i in (1, 2)
+        ]
+        
+        first, second = (pickle.loads(pickle.dumps(v)) for v in violations)
+        
+        self.assertEqual([first, second], violations)
+        self.assertIs(first.file_path, second.file_path)
+        self.assertIs(first.message, second.message)
+
+
 class TestReadabilityRules(unittest.TestCase):
     """Test readability rules."""
     
@@ -100,10 +160,17 @@ class TestSecurityRules(unittest.TestCase):
     def test_unsafe_eval(self):
         """Test UnsafeEvalRule."""
         rule = UnsafeEvalRule()
-        content = 'var expr = Expression.parse("2 + 2")\n'
+        content = (
+            'var expr = Expression.parse("2 + 2")\n'
+            'var spaced = Expression . parse("2 + 2")\n'
+            'var result = MyExpression.execute([])\n'
+            'var other = Expression . execute([])\n'
+        )
         
         violations = rule.check("test.gd", content)
-        self.assertEqual(len(violations), 1)
+        self.assertEqual([v.line_number for v in violations], [1, 4])
+        # Candidate lines are found without matching across a newline
+        self.assertEqual(list(rule.candidate_lines(FileView('var e = Expression\n\t.execute([])\n'))), [])
     
     def test_sql_injection(self):
         """Test SQLInjectionRiskRule."""
@@ -120,6 +187,33 @@ class TestSecurityRules(unittest.TestCase):
         
         violations = rule.check("test.gd", content)
         self.assertEqual(len(violations), 1)
+        # Files that only mention randomness in other words are skipped outright
+        self.assertFalse(rule.applies_to(FileView('var session_key = random_key(operand)\n')))
+    
+    def test_line_rule_set_matches_individual_rules(self):
+        """Test that the single-pass line rule set reports what each rule reports."""
+        rules = [
+            LineTooLongRule(max_length=40), HardcodedPasswordRule(), UnsafeEvalRule(),
+            SQLInjectionRiskRule(), InsecureRandomRule()
+        ]
+        content = (
+            'var password = "secret123"\n'
+            '# var pwd = "commented out"\n'
+            'var query = "SELECT * FROM users WHERE id = " + user_id\n'
+            'var token = str(randi())\n'
+            'var expr = Expression.parse("2 + 2")\n'
+        )
+        
+        # One view shared by every rule and the rule set
+        view = FileView(content)
+        expected = []
+        for rule in rules:
+            expected.extend(rule.check_view("test.gd", view))
+        violations = LineRuleSet(rules).check_view("test.gd", view)
+        
+        key = lambda v: (v.rule_id, v.line_number)
+        self.assertEqual([key(v) for v in violations], [key(v) for v in expected])
+        self.assertEqual({v.rule_id for v in violations}, {"R001", "S001", "S002", "S003", "S004"})
 
 
 class TestPerformanceRules(unittest.TestCase):
@@ -238,6 +332,31 @@ func _exit_tree():
         
         violations = rule.check("test.gd", content)
         self.assertEqual(len(violations), 0)
+    
+    def test_rule_set_matches_individual_rules(self):
+        """Test that the single-pass rule set reports what each rule reports."""
+        rules = [
+            ProcessInLoopRule(), StringConcatenationInLoopRule(),
+            UnusedSignalConnectionRule(), GetNodeInProcessRule()
+        ]
+        content = """func _process(delta):
+\tvar label = $Label
+\tfor i in range(10):
+\t\tvar node = get_node("Player")
+\t\tlabel.text += "x"
+\tsignal_obj.connect("my_signal", self, "_on_signal")
+"""
+        
+        # One view shared by every rule and the rule set
+        view = FileView(content)
+        expected = []
+        for rule in rules:
+            expected.extend(rule.check_view("test.gd", view))
+        violations = PerformanceRuleSet(rules).check_view("test.gd", view)
+        
+        key = lambda v: (v.rule_id, v.line_number)
+        self.assertEqual([key(v) for v in violations], [key(v) for v in expected])
+        self.assertEqual({v.rule_id for v in violations}, {"P001", "P002", "P003", "P004"})
 
 
 if __name__ == '__main__':